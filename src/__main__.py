@@ -0,0 +1,102 @@
+import argparse
+import json
+import os
+import sys
+from src.search_router import ALGORITHMS, DEFAULT_HEURISTIC_FILE, DEFAULT_MAP_FILE, SearchRouter, parse_query
+
+
+def non_negative_int(value):
+    # argparse type for budgets, where a negative count makes no sense
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
+
+def non_negative_float(value):
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
+
+def existing_file(value):
+    # argparse type for the data files, so a bad path is a usage error up front
+    # rather than a traceback when the file is first loaded
+    if not os.path.isfile(value):
+        raise argparse.ArgumentTypeError(f"no such file: '{value}'")
+    return value
+
+
+def run_route(args, stdin, stdout):
+    router = SearchRouter(args.map, args.heuristic, max_expansions=args.max_expansions, timeout=args.timeout)
+
+    queries = args.queries
+    if queries is sys.stdin:
+        # Read from the stream main() was given, which is sys.stdin outside of tests
+        queries = stdin
+
+    # Stream one result per query line so memory stays bounded by a single
+    # query no matter how long the input is
+    failures = 0
+    try:
+        for line_number, line in enumerate(queries, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                start_city, goal_city, algorithm = parse_query(line, args.algorithm)
+                output = router.route(start_city, goal_city, algorithm)
+            except (ValueError, OSError) as error:
+                # json.JSONDecodeError is a ValueError as well, OSError covers a
+                # heuristic file that became unreadable before its first use
+                failures += 1
+                output = {"line": line_number, "error": str(error)}
+            stdout.write(json.dumps(output) + "\n")
+            stdout.flush()
+    finally:
+        if args.queries is not sys.stdin:
+            args.queries.close()
+
+    return 1 if failures else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m src", description="Search the Romanian road map.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    route_parser = subparsers.add_parser(
+        "route",
+        help="Answer JSON-lines route queries",
+        description='Read one query per line, e.g. {"start": "Arad", "goal": "Bucharest", "algorithm": "a_star"}, '
+                    'and write one JSON result per line.'
+    )
+    route_parser.add_argument("queries", nargs="?", type=argparse.FileType('r', errors='replace'), default="-",
+                              help="File with JSON-lines queries (default: stdin)")
+    route_parser.add_argument("-a", "--algorithm", choices=ALGORITHMS, default="a_star",
+                              help="Algorithm used when a query does not name one (default: a_star)")
+    route_parser.add_argument("--map", type=existing_file, default=DEFAULT_MAP_FILE, help="Road map JSON file")
+    route_parser.add_argument("--heuristic", type=existing_file, default=DEFAULT_HEURISTIC_FILE,
+                              help="Straight-line distance to Bucharest JSON file")
+    route_parser.add_argument("--max-expansions", type=non_negative_int, default=None,
+                              help="Stop a query after expanding this many nodes")
+    route_parser.add_argument("--timeout", type=non_negative_float, default=None,
+                              help="Stop a query after this many seconds")
+    route_parser.set_defaults(handler=run_route)
+
+    return parser
+
+
+def main(argv=None, stdin=None, stdout=None):
+    args = build_parser().parse_args(argv)
+    if stdin is None:
+        stdin = sys.stdin
+        # Decode undecodable bytes as U+FFFD, like queries files, so a line of
+        # invalid UTF-8 is reported as a bad query instead of ending the stream
+        if hasattr(stdin, "reconfigure"):
+            stdin.reconfigure(errors="replace")
+    return args.handler(args, stdin, stdout or sys.stdout)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,49 @@
 import json
 import heapq
+try:
+    from src.search_control import run_search, reject_query, pause_interval
+except ModuleNotFoundError:
+    # Run as a script (python src/<module>.py), where src/ itself is on sys.path
+    from search_control import run_search, reject_query, pause_interval
 
 class AStarSearch:
-    def __init__(self, map_file, heuristic_file):
-        # Load the Romanian road map from the JSON file
-        with open(map_file, 'r') as f:
-            self.romania_map = json.load(f)
-        # Load the straight-line distance heuristic to Bucharest
-        with open(heuristic_file, 'r') as f:
-            self.heuristic_to_bucharest = json.load(f)
-
-    def a_star_search(self, start_city, goal_city):
+    def __init__(self, map_file=None, heuristic_file=None, romania_map=None, heuristic_to_bucharest=None):
+        # Load the Romanian road map from the JSON file, unless an already loaded map is given
+        if romania_map is None:
+            with open(map_file, 'r') as f:
+                romania_map = json.load(f)
+        self.romania_map = romania_map
+        # Load the straight-line distance heuristic to Bucharest, unless it is already loaded
+        if heuristic_to_bucharest is None:
+            with open(heuristic_file, 'r') as f:
+                heuristic_to_bucharest = json.load(f)
+        self.heuristic_to_bucharest = heuristic_to_bucharest
+
+    def a_star_search(self, start_city, goal_city, max_expansions=None, timeout=None, components=None):
+        # Run the stepwise search, stopping early if a budget runs out
+        return run_search(self.a_star_steps(start_city, goal_city, components=components,
+                                            yield_every=pause_interval(max_expansions, timeout)),
+                          max_expansions=max_expansions, timeout=timeout)
+
+    def a_star_steps(self, start_city, goal_city, yield_every=1, components=None):
+        """
+        A* search as a resumable generator.
+        Yields partial metrics before every yield_every-th expansion, then the final metrics.
+        """
+        # Validate the arguments and reject unreachable goals before searching
+        rejected = reject_query(start_city, goal_city, yield_every, components)
+        if rejected is not None:
+            yield rejected
+            return
+
         # Initialize the priority queue (min-heap)
         fringe = []
         heapq.heappush(fringe, (0 + self.heuristic_to_goal(start_city, goal_city), 0, start_city, [start_city]))
         visited = set()
         nodes_expanded = 0
         max_fringe_size = 0
+        # Expansion count of the next pause, never reached when yield_every is None
+        next_pause = -1 if yield_every is None else 0
 
         # Start A* Search
         while fringe:
@@ -28,14 +55,26 @@ class AStarSearch:
 
             # Check if the current city is the goal
             if current_city == goal_city:
-                return {
+                yield {
                     "path": path,
                     "nodes_expanded": nodes_expanded,
-                    "max_fringe_size": max_fringe_size
+                    "max_fringe_size": max_fringe_size,
+                    "status": "found"
                 }
+                return
 
             # If not visited, expand this node
             if current_city not in visited:
+                # Pause before the expansion so the caller can check its budget
+                if nodes_expanded == next_pause:
+                    yield {
+                        "path": [],
+                        "nodes_expanded": nodes_expanded,
+                        "max_fringe_size": max_fringe_size,
+                        "status": "running"
+                    }
+                    next_pause += yield_every
+
                 visited.add(current_city)
                 nodes_expanded += 1  # Track the number of nodes expanded
 
@@ -47,10 +86,11 @@ class AStarSearch:
                         heapq.heappush(fringe, (f_value, g_value, neighbor, path + [neighbor]))
 
         # If no path is found, return empty metrics
-        return {
+        yield {
             "path": [],
             "nodes_expanded": nodes_expanded,
-            "max_fringe_size": max_fringe_size
+            "max_fringe_size": max_fringe_size,
+            "status": "not_found"
         }
 
     def heuristic_to_goal(self, city, goal):
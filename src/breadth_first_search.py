@@ -1,22 +1,54 @@
 import json
 from collections import deque
 import time
+try:
+    from src.search_control import run_search, reject_query, pause_interval
+except ModuleNotFoundError:
+    # Run as a script (python src/<module>.py), where src/ itself is on sys.path
+    from search_control import run_search, reject_query, pause_interval
 
 class BreadthFirstSearch:
-    def __init__(self, map_file):
-        # Load the Romanian road map from the JSON file
-        with open(map_file, 'r') as f:
-            self.romania_map = json.load(f)
+    def __init__(self, map_file=None, romania_map=None):
+        # Load the Romanian road map from the JSON file, unless an already loaded map is given
+        if romania_map is None:
+            with open(map_file, 'r') as f:
+                romania_map = json.load(f)
+        self.romania_map = romania_map
+
+    def bfs_search(self, start_city, goal_city, max_expansions=None, timeout=None, components=None):
+        # Start timer
+        start_time = time.time()
+
+        # Run the stepwise search, stopping early if a budget runs out
+        result = run_search(self.bfs_steps(start_city, goal_city, components=components,
+                                           yield_every=pause_interval(max_expansions, timeout)),
+                            max_expansions=max_expansions, timeout=timeout)
+
+        end_time = time.time()
+        result["time_taken"] = end_time - start_time
+        return result
+
+    def bfs_steps(self, start_city, goal_city, yield_every=1, components=None):
+        """
+        Breadth-first search as a resumable generator.
+        Before every yield_every-th expansion it yields the partial metrics, with status
+        "running", so the caller can pause or cancel the search; the last item yielded is
+        the final metrics. With yield_every=None it never pauses. With component labels,
+        unreachable goals are rejected before any expansion.
+        """
+        # Validate the arguments and reject unreachable goals before searching
+        rejected = reject_query(start_city, goal_city, yield_every, components)
+        if rejected is not None:
+            yield rejected
+            return
 
-    def bfs_search(self, start_city, goal_city):
         # Initialize the fringe (queue) with the start node
         fringe = deque([(start_city, [start_city])])
         visited = set()
         nodes_expanded = 0
         max_fringe_size = 0
-
-        # Start timer
-        start_time = time.time()
+        # Expansion count of the next pause, never reached when yield_every is None
+        next_pause = -1 if yield_every is None else 0
 
         while fringe:
             # Track the max fringe size
@@ -27,16 +59,26 @@ class BreadthFirstSearch:
 
             # Test if this is the goal
             if current_city == goal_city:
-                end_time = time.time()
-                return {
+                yield {
                     "path": path,
                     "nodes_expanded": nodes_expanded,
-                    "time_taken": end_time - start_time,
-                    "max_fringe_size": max_fringe_size
+                    "max_fringe_size": max_fringe_size,
+                    "status": "found"
                 }
+                return
 
             # If not visited, expand this node
             if current_city not in visited:
+                # Pause before the expansion so the caller can check its budget
+                if nodes_expanded == next_pause:
+                    yield {
+                        "path": [],
+                        "nodes_expanded": nodes_expanded,
+                        "max_fringe_size": max_fringe_size,
+                        "status": "running"
+                    }
+                    next_pause += yield_every
+
                 visited.add(current_city)
                 nodes_expanded += 1  # Track the number of nodes expanded
 
@@ -46,12 +88,11 @@ class BreadthFirstSearch:
                         fringe.append((neighbor, path + [neighbor]))
 
         # If the queue is empty and no solution was found, return metrics with an empty path
-        end_time = time.time()
-        return {
+        yield {
             "path": [],
             "nodes_expanded": nodes_expanded,
-            "time_taken": end_time - start_time,
-            "max_fringe_size": max_fringe_size
+            "max_fringe_size": max_fringe_size,
+            "status": "not_found"
         }
 
 # Example usage
@@ -0,0 +1,113 @@
+import time
+from collections import deque
+
+def connected_components(romania_map):
+    """
+    Label every city with the id of its connected component.
+    Roads are treated as two-way and cities that only appear as neighbors are labeled
+    too, so an asymmetric map never splits connected cities. Two cities can only be
+    joined by a path if they share a label, so searches can reject unreachable goals
+    without exploring the start city's whole component.
+    """
+    # Build an undirected adjacency list from the (possibly one-way) map
+    adjacency = {}
+    for city, neighbors in romania_map.items():
+        adjacency.setdefault(city, set())
+        for neighbor in neighbors:
+            adjacency[city].add(neighbor)
+            adjacency.setdefault(neighbor, set()).add(city)
+
+    components = {}
+    label = 0
+    for city in adjacency:
+        if city in components:
+            continue
+
+        # Flood the component of this city with the current label
+        components[city] = label
+        queue = deque([city])
+        while queue:
+            current_city = queue.popleft()
+            for neighbor in adjacency[current_city]:
+                if neighbor not in components:
+                    components[neighbor] = label
+                    queue.append(neighbor)
+        label += 1
+
+    return components
+
+def is_reachable(components, start_city, goal_city):
+    """
+    Check with precomputed component labels whether a path from start to goal can exist.
+    Unknown cities are never reachable.
+    """
+    if start_city not in components or goal_city not in components:
+        return False
+    return components[start_city] == components[goal_city]
+
+def unreachable_result():
+    # Metrics for a query rejected before any node was expanded
+    return {
+        "path": [],
+        "nodes_expanded": 0,
+        "max_fringe_size": 0,
+        "status": "unreachable"
+    }
+
+def reject_query(start_city, goal_city, yield_every, components):
+    """
+    Checks shared by every stepwise search before it starts.
+    Raises ValueError for a yield_every below 1 (None means never pause). Returns the
+    result for a goal the component labels show to be unreachable, or None when the
+    search should run.
+    """
+    if yield_every is not None and yield_every < 1:
+        raise ValueError(f"yield_every must be at least 1, got {yield_every}")
+
+    if components is not None and not is_reachable(components, start_city, goal_city):
+        return unreachable_result()
+    return None
+
+def pause_interval(max_expansions=None, timeout=None):
+    """
+    How often a stepwise search needs to pause for run_search to enforce its budgets.
+    Without a budget there is nothing to check between expansions, so the search never
+    pauses and costs the same as a plain loop.
+    """
+    if max_expansions is None and timeout is None:
+        return None
+    return 1
+
+def run_search(steps, max_expansions=None, timeout=None):
+    """
+    Drive a stepwise search generator to completion, or until a budget runs out.
+    The generator yields partial metrics with status "running" before expanding a node,
+    and its final metrics last. Once more than max_expansions nodes would be expanded or
+    timeout seconds have passed, it is closed and the partial metrics are returned with
+    status "timed_out".
+    """
+    # A for loop finishes without raising StopIteration, which keeps the
+    # unbudgeted search as cheap as the plain loop it replaced
+    result = None
+    if max_expansions is None and timeout is None:
+        for result in steps:
+            pass
+        return result
+
+    deadline = None if timeout is None else time.perf_counter() + timeout
+    for metrics in steps:
+        if metrics["status"] != "running":
+            result = metrics
+            continue
+
+        out_of_expansions = max_expansions is not None and metrics["nodes_expanded"] >= max_expansions
+        out_of_time = deadline is not None and time.perf_counter() >= deadline
+        if out_of_expansions or out_of_time:
+            steps.close()
+            return {
+                "path": [],
+                "nodes_expanded": metrics["nodes_expanded"],
+                "max_fringe_size": metrics["max_fringe_size"],
+                "status": "timed_out"
+            }
+    return result
@@ -0,0 +1,117 @@
+import json
+import os
+import time
+from src.search_control import connected_components, pause_interval, run_search
+
+# Default data files, resolved relative to the repository root so the CLI
+# works from any working directory
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data'))
+DEFAULT_MAP_FILE = os.path.join(DATA_DIR, 'romania_map.json')
+DEFAULT_HEURISTIC_FILE = os.path.join(DATA_DIR, 'heuristic_to_bucharest.json')
+
+ALGORITHMS = ("bfs", "dfs", "best_first", "a_star")
+
+
+class SearchRouter:
+    """
+    Holds one instance of each search algorithm, all sharing a single copy of
+    the map that is loaded and labeled once per process. Algorithms are only
+    imported and built on first use, so a one-shot query pays for exactly the
+    algorithm it asks for. Every query runs under the router's expansion and
+    time budgets.
+    """
+    def __init__(self, map_file, heuristic_file, max_expansions=None, timeout=None):
+        with open(map_file, 'r') as f:
+            self.romania_map = json.load(f)
+        self.components = connected_components(self.romania_map)
+        self.heuristic_file = heuristic_file
+        self.heuristic_to_bucharest = None
+        self.max_expansions = max_expansions
+        self.timeout = timeout
+        self.searchers = {}
+
+    def heuristic(self):
+        # Only the informed searches need the heuristic, load it on first use
+        if self.heuristic_to_bucharest is None:
+            with open(self.heuristic_file, 'r') as f:
+                self.heuristic_to_bucharest = json.load(f)
+        return self.heuristic_to_bucharest
+
+    def searcher(self, algorithm):
+        if algorithm not in self.searchers:
+            if algorithm == "bfs":
+                from src.breadth_first_search import BreadthFirstSearch
+                self.searchers[algorithm] = BreadthFirstSearch(romania_map=self.romania_map)
+            elif algorithm == "dfs":
+                from src.depth_first_search import DepthFirstSearch
+                self.searchers[algorithm] = DepthFirstSearch(romania_map=self.romania_map)
+            elif algorithm == "best_first":
+                from src.best_first_search import BestFirstSearch
+                self.searchers[algorithm] = BestFirstSearch(romania_map=self.romania_map,
+                                                           heuristic_to_bucharest=self.heuristic())
+            elif algorithm == "a_star":
+                from src.a_star_search import AStarSearch
+                self.searchers[algorithm] = AStarSearch(romania_map=self.romania_map,
+                                                       heuristic_to_bucharest=self.heuristic())
+            else:
+                raise ValueError(f"Unknown algorithm '{algorithm}', expected one of {', '.join(ALGORITHMS)}")
+        return self.searchers[algorithm]
+
+    def route(self, start_city, goal_city, algorithm):
+        searcher = self.searcher(algorithm)
+
+        # Every algorithm indexes the map with the cities it pops, so reject
+        # unknown cities up front instead of failing inside the search loop
+        for city in (start_city, goal_city):
+            if city not in self.romania_map:
+                raise ValueError(f"Unknown city '{city}'")
+
+        yield_every = pause_interval(self.max_expansions, self.timeout)
+        if algorithm == "bfs":
+            steps = searcher.bfs_steps(start_city, goal_city, components=self.components,
+                                       yield_every=yield_every)
+        elif algorithm == "dfs":
+            steps = searcher.dfs_steps(start_city, goal_city, components=self.components,
+                                       yield_every=yield_every)
+        elif algorithm == "best_first":
+            steps = searcher.best_first_steps(start_city, goal_city, components=self.components,
+                                              yield_every=yield_every)
+        else:
+            steps = searcher.a_star_steps(start_city, goal_city, components=self.components,
+                                          yield_every=yield_every)
+
+        start_time = time.perf_counter()
+        result = run_search(steps, max_expansions=self.max_expansions, timeout=self.timeout)
+        time_taken = time.perf_counter() - start_time
+
+        return {
+            "start": start_city,
+            "goal": goal_city,
+            "algorithm": algorithm,
+            "status": result["status"],
+            "path": result["path"],
+            "nodes_expanded": result["nodes_expanded"],
+            "max_fringe_size": result["max_fringe_size"],
+            "time_taken": time_taken
+        }
+
+
+def parse_query(line, default_algorithm):
+    """
+    Parse one JSON-lines query. A query is either an object with "start",
+    "goal" and an optional "algorithm", or a [start, goal] pair.
+    """
+    query = json.loads(line)
+    if isinstance(query, list) and len(query) == 2:
+        start_city, goal_city, algorithm = query[0], query[1], default_algorithm
+    elif isinstance(query, dict) and "start" in query and "goal" in query:
+        start_city, goal_city, algorithm = query["start"], query["goal"], query.get("algorithm", default_algorithm)
+    else:
+        raise ValueError('Expected {"start": ..., "goal": ...} or [start, goal]')
+
+    # Cities and algorithms are used as dictionary keys, so anything but a
+    # string would fail with a TypeError further down
+    for field, value in (("start", start_city), ("goal", goal_city), ("algorithm", algorithm)):
+        if not isinstance(value, str):
+            raise ValueError(f"Expected '{field}' to be a string, got {json.dumps(value)}")
+    return start_city, goal_city, algorithm
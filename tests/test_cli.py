@@ -0,0 +1,189 @@
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from src.__main__ import main
+from src.search_router import SearchRouter, ALGORITHMS, DEFAULT_MAP_FILE, DEFAULT_HEURISTIC_FILE
+
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+class TestRouteCommand(unittest.TestCase):
+
+    def run_route(self, queries, *args):
+        stdout = io.StringIO()
+        exit_code = main(["route", *args], stdin=io.StringIO(queries), stdout=stdout)
+        results = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        return exit_code, results
+
+    def test_route_streams_one_result_per_query(self):
+        queries = (
+            '{"start": "Arad", "goal": "Bucharest"}\n'
+            '\n'
+            '{"start": "Arad", "goal": "Bucharest", "algorithm": "bfs"}\n'
+            '["Arad", "Pitesti"]\n'
+        )
+        exit_code, results = self.run_route(queries)
+
+        # Blank lines are skipped and every query gets its own result line
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]["algorithm"], "a_star")
+        self.assertEqual(results[0]["path"], ["Arad", "Sibiu", "Rimnicu Vilcea", "Pitesti", "Bucharest"])
+        self.assertEqual(results[1]["algorithm"], "bfs")
+        self.assertEqual(results[1]["path"][-1], "Bucharest")
+        self.assertEqual(results[2]["path"][0], "Arad")
+        self.assertEqual(results[2]["path"][-1], "Pitesti")
+        self.assertGreaterEqual(results[2]["time_taken"], 0)
+
+    def test_route_default_algorithm(self):
+        exit_code, results = self.run_route('["Arad", "Bucharest"]\n', "--algorithm", "dfs")
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(results[0]["algorithm"], "dfs")
+        self.assertEqual(results[0]["path"][-1], "Bucharest")
+
+    def test_route_reports_bad_lines_and_continues(self):
+        queries = (
+            'not json\n'
+            '{"start": "Arad", "goal": "NonExistentCity"}\n'
+            '{"start": "Arad", "goal": "Bucharest", "algorithm": "dijkstra"}\n'
+            '[["a"], "b"]\n'
+            '{"start": {"a": 1}, "goal": "Arad"}\n'
+            '{"start": "Arad", "goal": "Bucharest", "algorithm": ["x"]}\n'
+            '["Arad", "Bucharest"]\n'
+        )
+        exit_code, results = self.run_route(queries)
+
+        # Bad queries become error lines, the remaining queries are still answered
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(len(results), 7)
+        self.assertEqual([result.get("line") for result in results[:6]], [1, 2, 3, 4, 5, 6])
+        self.assertTrue(all("error" in result for result in results[:6]))
+        self.assertIn("NonExistentCity", results[1]["error"])
+        self.assertIn("dijkstra", results[2]["error"])
+        self.assertIn("'start'", results[3]["error"])
+        self.assertIn("'start'", results[4]["error"])
+        self.assertIn("'algorithm'", results[5]["error"])
+        self.assertEqual(results[6]["path"][-1], "Bucharest")
+
+    def test_route_reads_queries_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            queries_file = os.path.join(directory, "queries.jsonl")
+            with open(queries_file, 'w') as f:
+                f.write('["Arad", "Bucharest"]\n')
+            exit_code, results = self.run_route("", queries_file)
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(results[0]["path"][-1], "Bucharest")
+
+    def test_route_invalid_utf8_line(self):
+        queries = b'["Arad", "Bucharest"]\n\xff\xfe\n["Arad", "Sibiu"]\n'
+
+        # From a queries file
+        with tempfile.TemporaryDirectory() as directory:
+            queries_file = os.path.join(directory, "queries.jsonl")
+            with open(queries_file, 'wb') as f:
+                f.write(queries)
+            exit_code, results = self.run_route("", queries_file)
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(results[0]["path"][-1], "Bucharest")
+        self.assertEqual(results[1]["line"], 2)
+        self.assertIn("error", results[1])
+        self.assertEqual(results[2]["path"][-1], "Sibiu")
+
+        # From stdin
+        completed = subprocess.run([sys.executable, "-m", "src", "route"], cwd=REPO_DIR,
+                                   input=queries, capture_output=True)
+
+        self.assertEqual(completed.returncode, 1, completed.stderr)
+        results = [json.loads(line) for line in completed.stdout.splitlines()]
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[1]["line"], 2)
+        self.assertEqual(results[2]["path"][-1], "Sibiu")
+
+    def test_route_missing_queries_file(self):
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit) as context:
+            self.run_route("", "no_such_queries.jsonl")
+
+        # Reported as a usage error, like argparse's other errors
+        self.assertEqual(context.exception.code, 2)
+        self.assertIn("no_such_queries.jsonl", stderr.getvalue())
+
+    def test_route_missing_data_files(self):
+        # A bad --heuristic is reported before the bfs query runs, not when the
+        # informed query after it first needs the heuristic
+        queries = '{"start": "Arad", "goal": "Sibiu", "algorithm": "bfs"}\n["Arad", "Bucharest"]\n'
+        for args in (("--heuristic", "no_such_heuristic.json"), ("--map", "no_such_map.json")):
+            stderr = io.StringIO()
+            stdout = io.StringIO()
+            with contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit) as context:
+                main(["route", *args], stdin=io.StringIO(queries), stdout=stdout)
+
+            self.assertEqual(context.exception.code, 2)
+            self.assertIn(args[1], stderr.getvalue())
+            self.assertEqual(stdout.getvalue(), "")
+
+    def test_route_budget(self):
+        exit_code, results = self.run_route('["Arad", "Neamt"]\n["Arad", "Sibiu"]\n', "--max-expansions", "2")
+
+        # Budgets cut off long queries without failing the stream
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(results[0]["status"], "timed_out")
+        self.assertEqual(results[0]["path"], [])
+        self.assertEqual(results[0]["nodes_expanded"], 2)
+        self.assertEqual(results[1]["status"], "found")
+
+    def test_route_rejects_negative_budgets(self):
+        for args in (("--max-expansions", "-1"), ("--timeout", "-0.5")):
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit) as context:
+                self.run_route('["Arad", "Bucharest"]\n', *args)
+
+            self.assertEqual(context.exception.code, 2)
+            self.assertIn("must be 0 or more", stderr.getvalue())
+
+    def test_router_shares_one_map(self):
+        router = SearchRouter(DEFAULT_MAP_FILE, DEFAULT_HEURISTIC_FILE)
+        searchers = [router.searcher(algorithm) for algorithm in ALGORITHMS]
+
+        # Every algorithm searches the router's single copy of the map and heuristic
+        self.assertTrue(all(searcher.romania_map is router.romania_map for searcher in searchers))
+        self.assertIs(searchers[2].heuristic_to_bucharest, searchers[3].heuristic_to_bucharest)
+
+    def test_route_one_shot_subprocess(self):
+        # Test the real entry point the way a one-shot query runs it
+        completed = subprocess.run([sys.executable, "-m", "src", "route"], cwd=REPO_DIR,
+                                   input='["Arad", "Bucharest"]\n', capture_output=True, text=True)
+
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertEqual(json.loads(completed.stdout)["path"][-1], "Bucharest")
+
+    def test_route_does_not_import_plotting_libraries(self):
+        # Block matplotlib and NumPy in a fresh interpreter, so an eager import fails
+        # even where they are installed, then run a query and load the experiments module
+        script = (
+            "import importlib.abc, io, json, sys\n"
+            "class BlockPlotting(importlib.abc.MetaPathFinder):\n"
+            "    def find_spec(self, name, path, target=None):\n"
+            "        if name.split('.')[0] in ('matplotlib', 'numpy'):\n"
+            "            raise ImportError(name + ' imported eagerly')\n"
+            "sys.meta_path.insert(0, BlockPlotting())\n"
+            "from src.__main__ import main\n"
+            "main(['route'], stdin=io.StringIO('[\"Arad\", \"Bucharest\"]'), stdout=io.StringIO())\n"
+            "print(json.dumps(sorted(name for name in sys.modules if name.startswith('src.'))))\n"
+            "import tests.test_experimental_results\n"
+        )
+        completed = subprocess.run([sys.executable, "-c", script], cwd=REPO_DIR, capture_output=True, text=True)
+
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        # The one-shot query only loads the algorithm it asked for
+        self.assertEqual(json.loads(completed.stdout), ["src.__main__", "src.a_star_search", "src.search_control", "src.search_router"])
+
+if __name__ == "__main__":
+    unittest.main()
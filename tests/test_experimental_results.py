@@ -7,7 +7,6 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 import time
 import json
 import csv
-import matplotlib.pyplot as plt
 from src.breadth_first_search import BreadthFirstSearch
 from src.depth_first_search import DepthFirstSearch
 from src.best_first_search import BestFirstSearch
@@ -97,6 +96,10 @@ def save_results_to_csv(results, test_case):
         writer.writerows(results)
 
 def plot_results(results, test_case):
+    # Imported here so running or importing the experiments without plotting
+    # does not pay for (or require) matplotlib
+    import matplotlib.pyplot as plt
+
     # Ensure the results folder exists
     os.makedirs('results', exist_ok=True)
 
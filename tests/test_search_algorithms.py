@@ -3,6 +3,7 @@ from src.breadth_first_search import BreadthFirstSearch
 from src.depth_first_search import DepthFirstSearch
 from src.best_first_search import BestFirstSearch
 from src.a_star_search import AStarSearch
+from src.search_control import connected_components, run_search
 
 class TestRomanianSearch(unittest.TestCase):
     
@@ -13,6 +14,7 @@ class TestRomanianSearch(unittest.TestCase):
         cls.dfs_algo = DepthFirstSearch('data/romania_map.json')
         cls.best_first_algo = BestFirstSearch('data/romania_map.json', 'data/heuristic_to_bucharest.json')
         cls.a_star_algo = AStarSearch('data/romania_map.json', 'data/heuristic_to_bucharest.json')
+        cls.components = connected_components(cls.bfs_algo.romania_map)
         
     # Breadth-First Search Tests
     def test_bfs_path_found(self):
@@ -206,5 +208,98 @@ class TestRomanianSearch(unittest.TestCase):
         self.assertGreater(result['nodes_expanded'], 0)
         self.assertGreaterEqual(result['max_fringe_size'], 0)
 
+    # Stepwise Search Tests
+    def test_steps_yield_partial_metrics(self):
+        # Test that the A* stepper pauses before each expansion and yields the final metrics last
+        items = list(self.a_star_algo.a_star_steps("Arad", "Bucharest"))
+        partial, final = items[:-1], items[-1]
+
+        self.assertEqual([metrics['nodes_expanded'] for metrics in partial], list(range(len(partial))))
+        self.assertTrue(all(metrics['path'] == [] and metrics['status'] == "running" for metrics in partial))
+        self.assertEqual(final, self.a_star_algo.a_star_search("Arad", "Bucharest"))
+        self.assertEqual(len(partial), final['nodes_expanded'])
+
+    def test_steps_yield_every(self):
+        # Test that yield_every controls how often the stepper pauses
+        items = list(self.bfs_algo.bfs_steps("Arad", "NonExistentCity", yield_every=5))
+        self.assertEqual([metrics['nodes_expanded'] for metrics in items[:-1]], [0, 5, 10, 15])
+        self.assertEqual(items[-1]['status'], "not_found")
+
+        # Without yield_every the stepper never pauses and only yields the final metrics
+        items = list(self.dfs_algo.dfs_steps("Arad", "Bucharest", yield_every=None))
+        self.assertEqual(len(items), 1)
+        self.assertEqual(items[0]['status'], "found")
+
+    def test_steps_yield_every_must_be_positive(self):
+        # Test that the steppers reject a yield_every that would never pause correctly
+        for steps in (self.bfs_algo.bfs_steps, self.dfs_algo.dfs_steps,
+                      self.best_first_algo.best_first_steps, self.a_star_algo.a_star_steps):
+            for yield_every in (0, -1):
+                with self.assertRaises(ValueError):
+                    next(steps("Arad", "Bucharest", yield_every=yield_every))
+
+    def test_search_status(self):
+        # Test that the final metrics report whether the goal was found
+        self.assertEqual(self.dfs_algo.dfs_search("Arad", "Bucharest")['status'], "found")
+        self.assertEqual(self.dfs_algo.dfs_search("Arad", "NonExistentCity")['status'], "not_found")
+
+    def test_max_expansions_budget(self):
+        # Test that the unreachable-goal search is cut off after the expansion budget
+        for search in (self.bfs_algo.bfs_search, self.dfs_algo.dfs_search,
+                       self.best_first_algo.best_first_search, self.a_star_algo.a_star_search):
+            result = search("Arad", "NonExistentCity", max_expansions=3)
+
+            self.assertEqual(result['status'], "timed_out")
+            self.assertEqual(result['path'], [])
+            self.assertEqual(result['nodes_expanded'], 3)
+            self.assertGreater(result['max_fringe_size'], 0)
+
+    def test_max_expansions_budget_not_reached(self):
+        # Test that a search finishing within its budget is not reported as timed out
+        result = self.a_star_algo.a_star_search("Arad", "Bucharest", max_expansions=5)
+
+        self.assertEqual(result['status'], "found")
+        self.assertEqual(result['path'][-1], "Bucharest")
+
+    def test_timeout_budget(self):
+        # Test that an already expired deadline stops the search before any expansion
+        result = self.bfs_algo.bfs_search("Arad", "NonExistentCity", timeout=0)
+
+        self.assertEqual(result['status'], "timed_out")
+        self.assertEqual(result['nodes_expanded'], 0)
+        self.assertGreaterEqual(result['time_taken'], 0)
+
+    def test_cancel_steps(self):
+        # Test that a caller can cancel a search by closing its stepper
+        steps = self.best_first_algo.best_first_steps("Arad", "NonExistentCity")
+        next(steps)
+        steps.close()
+
+        self.assertIsNone(next(steps, None))
+
+    def test_unreachable_goal_rejected(self):
+        # Test that component labels reject unreachable goals without expanding any node
+        graph = {"A": {"B": 1}, "B": {"A": 1}, "C": {}}
+        components = connected_components(graph)
+        self.assertEqual(components["A"], components["B"])
+        self.assertNotEqual(components["A"], components["C"])
+
+        result = self.a_star_algo.a_star_search("Arad", "NonExistentCity", components=self.components)
+        self.assertEqual(result['status'], "unreachable")
+        self.assertEqual(result['nodes_expanded'], 0)
+
+        result = run_search(self.dfs_algo.dfs_steps("Arad", "Neamt", components=self.components))
+        self.assertEqual(result['status'], "found")
+
+    def test_connected_components_asymmetric_map(self):
+        # Test that one-way roads and cities missing as top-level keys keep a single component
+        graph = {"A": {"B": 1}, "C": {"B": 1}, "D": {"E": 1}}
+        components = connected_components(graph)
+
+        self.assertEqual(components["A"], components["B"])
+        self.assertEqual(components["A"], components["C"])
+        self.assertEqual(components["D"], components["E"])
+        self.assertNotEqual(components["A"], components["D"])
+
 if __name__ == "__main__":
     unittest.main()